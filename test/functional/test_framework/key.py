@@ -14,11 +14,19 @@ import unittest
 
 from .util import modinv
 
+# Map from tag to a SHA256 object which has already absorbed the
+# SHA256(tag) || SHA256(tag) prefix, so it only has to be computed once per tag.
+TAGGED_HASH_MIDSTATES = {}
+
 def TaggedHash(tag, data):
-    ss = hashlib.sha256(tag.encode('utf-8')).digest()
-    ss += ss
-    ss += data
-    return hashlib.sha256(ss).digest()
+    midstate = TAGGED_HASH_MIDSTATES.get(tag)
+    if midstate is None:
+        tag_hash = hashlib.sha256(tag.encode('utf-8')).digest()
+        midstate = hashlib.sha256(tag_hash + tag_hash)
+        TAGGED_HASH_MIDSTATES[tag] = midstate
+    ss = midstate.copy()
+    ss.update(data)
+    return ss.digest()
 
 def jacobi_symbol(n, k):
     """Compute the Jacobi symbol of n modulo k
@@ -16,7 +16,9 @@ from typing import List, Dict
 from .key import TaggedHash, tweak_add_pubkey
 
 from .messages import (
+    COutPoint,
     CTransaction,
+    CTxIn,
     CTxOut,
     hash256,
     ser_string,
@@ -742,7 +744,58 @@ class TestFrameworkScript(unittest.TestCase):
         for value in values:
             self.assertEqual(CScriptNum.decode(CScriptNum.encode(CScriptNum(value))), value)
 
-def TaprootSignatureHash(txTo, spent_utxos, hash_type, input_index = 0, scriptpath = False, script = CScript(), codeseparator_pos = -1, annex = None, leaf_ver = LEAF_VERSION_TAPSCRIPT):
+    def test_taproot_sighash_precomputed(self):
+        # signature hashes computed with shared precomputed data must match the standalone computation
+        tx = CTransaction()
+        tx.vin = [CTxIn(COutPoint(i + 1, i), nSequence=0xfffffffe - i) for i in range(3)]
+        tx.vout = [CTxOut(1000 * (i + 1), CScript([OP_1, bytes([i]) * 32])) for i in range(2)]
+        utxos = [CTxOut(5000 * (i + 1), CScript([OP_1, bytes([0x10 + i]) * 32])) for i in range(3)]
+        precomputed = BIP341_precompute(tx, utxos)
+        for hash_type in [SIGHASH_DEFAULT, SIGHASH_ALL, SIGHASH_NONE, SIGHASH_SINGLE, SIGHASH_ALL | SIGHASH_ANYONECANPAY, SIGHASH_NONE | SIGHASH_ANYONECANPAY]:
+            for i in range(len(tx.vin)):
+                self.assertEqual(TaprootSignatureHash(tx, utxos, hash_type, i, precomputed=precomputed), TaprootSignatureHash(tx, utxos, hash_type, i))
+
+def BIP341_sha_prevouts(txTo):
+    return sha256(b"".join(i.prevout.serialize() for i in txTo.vin))
+
+def BIP341_sha_amounts(spent_utxos):
+    return sha256(b"".join(struct.pack("<q", u.nValue) for u in spent_utxos))
+
+def BIP341_sha_scriptpubkeys(spent_utxos):
+    return sha256(b"".join(ser_string(u.scriptPubKey) for u in spent_utxos))
+
+def BIP341_sha_sequences(txTo):
+    return sha256(b"".join(struct.pack("<I", i.nSequence) for i in txTo.vin))
+
+def BIP341_sha_outputs(txTo):
+    return sha256(b"".join(o.serialize() for o in txTo.vout))
+
+# A BIP341Precomputed object holds the transaction-wide hashes which are shared
+# by the BIP341 signature hashes of all inputs of a transaction:
+# - sha_prevouts: BIP341_sha_prevouts(txTo)
+# - sha_amounts: BIP341_sha_amounts(spent_utxos)
+# - sha_scriptpubkeys: BIP341_sha_scriptpubkeys(spent_utxos)
+# - sha_sequences: BIP341_sha_sequences(txTo)
+# - sha_outputs: BIP341_sha_outputs(txTo)
+BIP341Precomputed = namedtuple("BIP341Precomputed", "sha_prevouts,sha_amounts,sha_scriptpubkeys,sha_sequences,sha_outputs")
+
+def BIP341_precompute(txTo, spent_utxos):
+    """Compute the BIP341Precomputed data for txTo spending spent_utxos.
+
+    When signing several inputs of the same transaction, pass the result to
+    TaprootSignatureHash so these hashes are computed once rather than once
+    per input. It must be recomputed if txTo or spent_utxos change.
+    """
+    assert (len(txTo.vin) == len(spent_utxos))
+    return BIP341Precomputed(
+        BIP341_sha_prevouts(txTo),
+        BIP341_sha_amounts(spent_utxos),
+        BIP341_sha_scriptpubkeys(spent_utxos),
+        BIP341_sha_sequences(txTo),
+        BIP341_sha_outputs(txTo),
+    )
+
+def TaprootSignatureHash(txTo, spent_utxos, hash_type, input_index = 0, scriptpath = False, script = CScript(), codeseparator_pos = -1, annex = None, leaf_ver = LEAF_VERSION_TAPSCRIPT, precomputed = None):
     assert (len(txTo.vin) == len(spent_utxos))
     assert (input_index < len(txTo.vin))
     out_type = SIGHASH_ALL if hash_type == 0 else hash_type & 3
@@ -752,12 +805,18 @@ def TaprootSignatureHash(txTo, spent_utxos, hash_type, input_index = 0, scriptpa
     ss += struct.pack("<i", txTo.nVersion)
     ss += struct.pack("<I", txTo.nLockTime)
     if in_type != SIGHASH_ANYONECANPAY:
-        ss += sha256(b"".join(i.prevout.serialize() for i in txTo.vin))
-        ss += sha256(b"".join(struct.pack("<q", u.nValue) for u in spent_utxos))
-        ss += sha256(b"".join(ser_string(u.scriptPubKey) for u in spent_utxos))
-        ss += sha256(b"".join(struct.pack("<I", i.nSequence) for i in txTo.vin))
+        if precomputed is not None:
+            ss += precomputed.sha_prevouts
+            ss += precomputed.sha_amounts
+            ss += precomputed.sha_scriptpubkeys
+            ss += precomputed.sha_sequences
+        else:
+            ss += BIP341_sha_prevouts(txTo)
+            ss += BIP341_sha_amounts(spent_utxos)
+            ss += BIP341_sha_scriptpubkeys(spent_utxos)
+            ss += BIP341_sha_sequences(txTo)
     if out_type == SIGHASH_ALL:
-        ss += sha256(b"".join(o.serialize() for o in txTo.vout))
+        ss += precomputed.sha_outputs if precomputed is not None else BIP341_sha_outputs(txTo)
     spend_type = 0
     if annex is not None:
         spend_type |= 1
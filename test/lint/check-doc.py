@@ -14,12 +14,15 @@ from subprocess import check_output
 import re
 
 FOLDER_GREP = 'src'
-FOLDER_TEST = 'src/test/'
+FOLDERS_TEST = ['src/test/', 'src/wallet/test/', 'src/qt/test/']
 REGEX_ARG = r'(?:ForceSet|SoftSet|Get|Is)(?:Bool)?Args?(?:Set)?\("(-[^"]+)"'
 REGEX_DOC = r'AddArg\("(-[^"=]+?)(?:=|")'
+RE_ARG = re.compile(REGEX_ARG)
+RE_DOC = re.compile(REGEX_DOC)
+RE_HIDDEN_ARG = re.compile(r'    "([^"=]+)')
 CMD_ROOT_DIR = '$(git rev-parse --show-toplevel)/{}'.format(FOLDER_GREP)
-CMD_GREP_ARGS = r"git grep --perl-regexp '{}' -- {} ':(exclude){}'".format(REGEX_ARG, CMD_ROOT_DIR, FOLDER_TEST)
-CMD_GREP_WALLET_ARGS = r"git grep --function-context 'void WalletInit::AddWalletOptions' -- {} | grep AddArg".format(CMD_ROOT_DIR)
+CMD_GREP_ARGS = r"git grep --perl-regexp '{}' -- {} {}".format(REGEX_ARG, CMD_ROOT_DIR, ' '.join("':(exclude){}'".format(f) for f in FOLDERS_TEST))
+CMD_GREP_WALLET_ARGS = r"git grep --function-context 'void WalletInit::AddWalletOptions' -- {}".format(CMD_ROOT_DIR)
 CMD_GREP_WALLET_HIDDEN_ARGS = r"git grep --function-context 'void DummyWalletInit::AddWalletOptions' -- {}".format(CMD_ROOT_DIR)
 CMD_GREP_DOCS = r"git grep --perl-regexp '{}' {}".format(REGEX_DOC, CMD_ROOT_DIR)
 # list unsupported, deprecated and duplicate args as they need no documentation
@@ -30,8 +33,8 @@ def lint_missing_argument_documentation():
     used = check_output(CMD_GREP_ARGS, shell=True).decode('utf8').strip()
     docd = check_output(CMD_GREP_DOCS, shell=True).decode('utf8').strip()
 
-    args_used = set(re.findall(re.compile(REGEX_ARG), used))
-    args_docd = set(re.findall(re.compile(REGEX_DOC), docd)).union(SET_DOC_OPTIONAL)
+    args_used = set(RE_ARG.findall(used))
+    args_docd = set(RE_DOC.findall(docd)).union(SET_DOC_OPTIONAL)
     args_need_doc = args_used.difference(args_docd)
     args_unknown = args_docd.difference(args_used)
 
@@ -49,8 +52,8 @@ def lint_missing_hidden_wallet_args():
     wallet_args = check_output(CMD_GREP_WALLET_ARGS, shell=True).decode('utf8').strip()
     wallet_hidden_args = check_output(CMD_GREP_WALLET_HIDDEN_ARGS, shell=True).decode('utf8').strip()
 
-    wallet_args = set(re.findall(re.compile(REGEX_DOC), wallet_args))
-    wallet_hidden_args = set(re.findall(re.compile(r'    "([^"=]+)'), wallet_hidden_args))
+    wallet_args = set(RE_DOC.findall(wallet_args))
+    wallet_hidden_args = set(RE_HIDDEN_ARG.findall(wallet_hidden_args))
 
     hidden_missing = wallet_args.difference(wallet_hidden_args)
     if hidden_missing: